@@ -3,9 +3,9 @@ Generate secure API keys for the Job Portal Skills API
 """
 import secrets
 
-def generate_api_key():
+def generate_api_key() -> str:
     """Generate a new secure API key"""
-    return f"sk_{secrets.token_hex(16)}"
+    return "sk_" + secrets.token_hex(16)
 
 if __name__ == "__main__":
     print("\n🔑 API Key Generator")
@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for running the API in production
+Usage: gunicorn main:app -c gunicorn.conf.py
+(`python main.py` is meant for local development only)
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# All API data is read-only and in memory, so one process per core scales safely
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", (2 * (os.cpu_count() or 1)) + 1))
+
+# Load the app before forking so the precomputed responses are built once
+# and shared copy-on-write between workers
+preload_app = True
+
+loglevel = "warning"
+accesslog = None
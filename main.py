@@ -1,27 +1,60 @@
-from fastapi import FastAPI, HTTPException, Query, Security, status, Request
+from fastapi import FastAPI, HTTPException, Query, Request, Security, status
+from fastapi.responses import JSONResponse, Response
 from fastapi.security import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 from skills_data import job_skills, common_positions
-from degrees_data import COMMON_DEGREES, DEGREE_CATEGORIES, search_degrees, get_degrees_by_category, get_all_categories
+from degrees_data import COMMON_DEGREES, search_degrees, get_degrees_by_category, get_all_categories
+from generate_api_key import generate_api_key  # Re-exported for admin use
 from dotenv import load_dotenv
-import uvicorn
-import secrets
+import ahocorasick
+import anyio.to_thread
+import orjson
+import gzip
+import hashlib
+import hmac
 import os
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson (FastAPI's own ORJSONResponse is deprecated)"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+# Every endpoint must stay `async def` and never block: all data lives in memory
+# and load_dotenv() runs once at import. The AnyIO thread limiter only backs
+# sync dependencies, so raise it above the default of 40 for burst load.
+THREADPOOL_TOKENS = 100
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the worker process on startup"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
+    yield
+
+
 app = FastAPI(
     title="Job Portal Skills API",
     description="API for retrieving job positions and their relevant skills (API Key Required)",
     version="1.0.0",
     docs_url=None,  # Disable default docs
     redoc_url=None,  # Disable default redoc
-    openapi_url=None  # Disable default openapi
+    openapi_url=None,  # Disable default openapi
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan
 )
 
 # API Key Configuration
@@ -34,31 +67,57 @@ api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=True)
 api_keys_env = os.getenv("API_KEYS")
 if not api_keys_env:
     raise ValueError("API_KEYS environment variable is not set. Please configure it in your .env file or environment.")
-VALID_API_KEYS = set(key.strip() for key in api_keys_env.split(",") if key.strip())
 
-# Function to generate new API keys (for admin use)
-def generate_api_key() -> str:
-    """Generate a new secure API key"""
-    return f"sk_{''.join(secrets.token_hex(16))}"
+# Keys shorter than this are rejected at startup
+MIN_API_KEY_LENGTH = 16
+
+
+def _hash_api_key(api_key: str) -> bytes:
+    """Return the short digest used to compare API keys"""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+
+
+# Only digests are kept and compared per request, never the raw keys
+VALID_API_KEY_HASHES = frozenset(
+    _hash_api_key(key.strip()) for key in api_keys_env.split(",")
+    if len(key.strip()) >= MIN_API_KEY_LENGTH
+)
+if not VALID_API_KEY_HASHES:
+    raise ValueError(f"API_KEYS must contain at least one key of {MIN_API_KEY_LENGTH} or more characters.")
 
 async def verify_api_key(api_key: str = Security(api_key_header)) -> str:
     """Verify the API key from request headers"""
-    if api_key in VALID_API_KEYS:
-        return api_key
+    digest = _hash_api_key(api_key)
+    if digest in VALID_API_KEY_HASHES:
+        # Confirm the match with a timing-safe comparison
+        for stored in VALID_API_KEY_HASHES:
+            if hmac.compare_digest(digest, stored):
+                return api_key
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid or missing API Key. Please provide a valid API key in the X-API-Key header."
     )
 
 # Configure CORS
+# Restrict browser origins with CORS_ORIGINS (comma-separated) and/or
+# CORS_ORIGIN_REGEX; when neither is set any origin is allowed.
+# Credentials are not needed since authentication uses the X-API-Key header.
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()
+)
+CORS_ORIGIN_REGEX = os.getenv("CORS_ORIGIN_REGEX") or None
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this for production
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS if CORS_ORIGINS or CORS_ORIGIN_REGEX else ["*"],
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger dynamic responses; cached bodies below ship pre-gzipped
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 
 # Response Models
 class SkillsResponse(BaseModel):
@@ -109,28 +168,107 @@ class DegreeCategoryResponse(BaseModel):
     total_count: int
 
 
+# Position lookup indexes (built once at startup so requests never scan job_skills)
+JOB_SKILLS_NORMALIZED = {key.lower().strip(): skills for key, skills in job_skills.items()}
+_POSITION_RANK = {key: rank for rank, key in enumerate(JOB_SKILLS_NORMALIZED)}
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return every length-3 substring of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _build_substring_index() -> Dict[str, List[str]]:
+    """Map each trigram to the position keys containing it"""
+    index: Dict[str, List[str]] = {}
+    for key in JOB_SKILLS_NORMALIZED:
+        for gram in _trigrams(key):
+            index.setdefault(gram, []).append(key)
+    return index
+
+
+def _build_position_automaton() -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton matching every position key"""
+    automaton = ahocorasick.Automaton()
+    for key in JOB_SKILLS_NORMALIZED:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+
+SUBSTR_INDEX = _build_substring_index()
+POSITION_AUTOMATON = _build_position_automaton()
+
+
+def _resolve_position(normalized_position: str) -> Optional[str]:
+    """Resolve a normalized position to a job_skills key (exact match first, then partial)"""
+    if normalized_position in JOB_SKILLS_NORMALIZED:
+        return normalized_position
+
+    # Keys contained in the query, found in a single pass over the query
+    candidates = {key for _, key in POSITION_AUTOMATON.iter(normalized_position)}
+
+    # Keys containing the query share all of its trigrams; queries too short
+    # to have a trigram fall back to a full scan
+    if len(normalized_position) < 3:
+        candidates.update(key for key in JOB_SKILLS_NORMALIZED if normalized_position in key)
+    else:
+        query_grams = _trigrams(normalized_position)
+        hits: Dict[str, int] = {}
+        for gram in query_grams:
+            for key in SUBSTR_INDEX.get(gram, ()):
+                hits[key] = hits.get(key, 0) + 1
+        candidates.update(
+            key for key, count in hits.items()
+            if count == len(query_grams) and normalized_position in key
+        )
+
+    if not candidates:
+        return None
+    # Keep the original job_skills order so the first match wins as before
+    return min(candidates, key=_POSITION_RANK.__getitem__)
+
+
+# Static responses are serialized once at startup and served as raw bytes
+ROOT_JSON = orjson.dumps({
+    "message": "Welcome to Job Portal Skills API",
+    "version": "1.0.0",
+    "authentication": "API Key required in X-API-Key header",
+    "endpoints": {
+        "positions": "/api/positions",
+        "skills": "/api/skills/{position}",
+        "suggestions": "/api/suggestions",
+        "categories": "/api/categories",
+        "all_jobs": "/api/all-jobs",
+        "degrees": "/api/degrees",
+        "degrees_search": "/api/degrees/search",
+        "degree_categories": "/api/degrees/categories"
+    },
+    "documentation": {
+        "swagger": "/docs (requires API key)",
+        "redoc": "/redoc (requires API key)"
+    }
+})
+
+HEALTH_JSON = orjson.dumps({"status": "healthy", "service": "Job Portal Skills API"})
+
+
+def _cached_json_response(request: Request, body: bytes, gzipped: bytes) -> Response:
+    """Serve a cached JSON body, using its gzipped copy when the client accepts gzip"""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            gzipped,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    # GZipMiddleware adds the Vary header to uncompressed responses itself
+    return Response(body, media_type="application/json")
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Welcome endpoint with API information (No API key required)"""
-    return {
-        "message": "Welcome to Job Portal Skills API",
-        "version": "1.0.0",
-        "authentication": "API Key required in X-API-Key header",
-        "endpoints": {
-            "positions": "/api/positions",
-            "skills": "/api/skills/{position}",
-            "suggestions": "/api/suggestions",
-            "categories": "/api/categories",
-            "all_jobs": "/api/all-jobs",
-            "degrees": "/api/degrees",
-            "degrees_search": "/api/degrees/search",
-            "degree_categories": "/api/degrees/categories"
-        },
-        "documentation": {
-            "swagger": "/docs (requires API key)",
-            "redoc": "/redoc (requires API key)"
-        }
-    }
+    return Response(ROOT_JSON, media_type="application/json")
 
 
 # Protected Documentation Endpoints
@@ -152,27 +290,48 @@ async def get_redoc_documentation(api_key: str = Security(verify_api_key)):
     )
 
 
+# Encoded OpenAPI schema, built on first request once every route is registered
+OPENAPI_JSON_BYTES: Optional[bytes] = None
+
+
 @app.get("/openapi.json", include_in_schema=False)
 async def get_open_api_endpoint(api_key: str = Security(verify_api_key)):
     """OpenAPI schema (API Key Required)"""
-    return get_openapi(
-        title=app.title,
-        version=app.version,
-        description=app.description,
-        routes=app.routes,
-    )
+    global OPENAPI_JSON_BYTES
+    if OPENAPI_JSON_BYTES is None:
+        if app.openapi_schema is None:
+            app.openapi_schema = get_openapi(
+                title=app.title,
+                version=app.version,
+                description=app.description,
+                routes=app.routes,
+            )
+        OPENAPI_JSON_BYTES = orjson.dumps(app.openapi_schema)
+    return Response(OPENAPI_JSON_BYTES, media_type="application/json")
+
+
+POSITIONS_JSON = orjson.dumps({
+    "positions": common_positions,
+    "total_count": len(common_positions)
+})
+POSITIONS_JSON_GZ = gzip.compress(POSITIONS_JSON, 9)
+
+
+@app.get("/api/positions", responses={200: {"model": PositionsResponse}}, tags=["Positions"])
+async def get_all_positions(request: Request, api_key: str = Security(verify_api_key)):
+    """Get all available job positions (API Key Required)"""
+    return _cached_json_response(request, POSITIONS_JSON, POSITIONS_JSON_GZ)
 
 
-@app.get("/api/positions", response_model=PositionsResponse, tags=["Positions"])
-async def get_all_positions(api_key: str = Security(verify_api_key)):
-    """Get all available job positions (API Key Required)"""
-    return {
-        "positions": common_positions,
-        "total_count": len(common_positions)
-    }
+# Encoded skills for each position key. The response echoes the requested
+# position, so only the part of the body after it is cached.
+SKILLS_JSON_CACHE: Dict[str, bytes] = {
+    key: orjson.dumps({"skills": skills, "skills_count": len(skills)})[1:]
+    for key, skills in JOB_SKILLS_NORMALIZED.items()
+}
 
 
-@app.get("/api/skills/{position}", response_model=SkillsResponse, tags=["Skills"])
+@app.get("/api/skills/{position}", responses={200: {"model": SkillsResponse}}, tags=["Skills"])
 async def get_skills_for_position(position: str, api_key: str = Security(verify_api_key)):
     """
     Get relevant skills for a specific job position (API Key Required)
@@ -181,23 +340,10 @@ async def get_skills_for_position(position: str, api_key: str = Security(verify_
     """
     normalized_position = position.lower().strip()
 
-    # Try exact match first
-    if normalized_position in job_skills:
-        skills = job_skills[normalized_position]
-        return {
-            "position": position,
-            "skills": skills,
-            "skills_count": len(skills)
-        }
-
-    # Try partial match
-    for key, skills in job_skills.items():
-        if normalized_position in key or key in normalized_position:
-            return {
-                "position": position,
-                "skills": skills,
-                "skills_count": len(skills)
-            }
+    key = _resolve_position(normalized_position)
+    if key is not None:
+        body = b'{"position":' + orjson.dumps(position) + b"," + SKILLS_JSON_CACHE[key]
+        return Response(body, media_type="application/json")
 
     raise HTTPException(
         status_code=404,
@@ -205,7 +351,41 @@ async def get_skills_for_position(position: str, api_key: str = Security(verify_
     )
 
 
-@app.get("/api/suggestions", response_model=PositionSuggestionsResponse, tags=["Positions"])
+# Lowercased positions, aligned index-for-index with common_positions
+LOWER_POSITIONS = [position.lower() for position in common_positions]
+
+
+def _build_suggestion_index() -> Dict[str, List[int]]:
+    """Map every 1-3 character substring to the indexes of positions containing it"""
+    index: Dict[str, List[int]] = defaultdict(list)
+    for position_index, lower_position in enumerate(LOWER_POSITIONS):
+        grams = {
+            lower_position[start:start + size]
+            for size in range(1, 4)
+            for start in range(len(lower_position) - size + 1)
+        }
+        for gram in grams:
+            index[gram].append(position_index)
+    return dict(index)
+
+
+SUGGESTION_INDEX = _build_suggestion_index()
+
+
+@lru_cache(maxsize=512)
+def _suggest_positions(lower_query: str) -> Tuple[str, ...]:
+    """Return up to 10 positions containing the lowercased query"""
+    # Any position containing the query also contains its first three characters
+    suggestions = []
+    for index in SUGGESTION_INDEX.get(lower_query[:3], ()):
+        if lower_query in LOWER_POSITIONS[index]:
+            suggestions.append(common_positions[index])
+            if len(suggestions) == 10:  # Limit to top 10 matches
+                break
+    return tuple(suggestions)
+
+
+@app.get("/api/suggestions", responses={200: {"model": PositionSuggestionsResponse}}, tags=["Positions"])
 async def get_position_suggestions(
     q: str = Query(..., min_length=1, description="Search query for job position"),
     api_key: str = Security(verify_api_key)
@@ -215,144 +395,155 @@ async def get_position_suggestions(
 
     - **q**: Search query (minimum 1 character)
     """
-    if not q.strip():
+    stripped = q.strip()
+    if not stripped:
         return {
             "suggestions": [],
             "query": q
         }
 
-    lower_query = q.lower()
-    suggestions = [
-        position for position in common_positions
-        if lower_query in position.lower()
-    ][:10]  # Limit to top 10 matches
-
     return {
-        "suggestions": suggestions,
+        "suggestions": _suggest_positions(stripped.lower()),
         "query": q
     }
 
 
-@app.get("/api/categories", response_model=List[JobCategoryResponse], tags=["Categories"])
-async def get_job_categories(api_key: str = Security(verify_api_key)):
+# Job positions grouped by category for /api/categories
+JOB_CATEGORIES = {
+    "Software Development": [
+        "Software Developer",
+        "Software Engineer",
+        "Full Stack Developer",
+        "Frontend Developer",
+        "Backend Developer",
+        "Mobile Developer",
+    ],
+    "Data & AI": [
+        "Data Scientist",
+        "Data Analyst",
+        "Data Engineer",
+        "Machine Learning Engineer",
+        "AI Engineer",
+    ],
+    "DevOps & Cloud": [
+        "DevOps Engineer",
+        "Cloud Engineer",
+        "System Administrator",
+        "Network Engineer",
+        "Database Administrator",
+    ],
+    "Design": [
+        "UI/UX Designer",
+        "Graphic Designer",
+        "Web Designer",
+    ],
+    "Management": [
+        "Product Manager",
+        "Project Manager",
+        "Scrum Master",
+    ],
+    "Quality Assurance": [
+        "Quality Assurance Engineer",
+        "QA Tester",
+    ],
+    "Security": [
+        "Security Engineer",
+    ],
+    "Business": [
+        "Business Analyst",
+        "Marketing Manager",
+        "Sales Manager",
+        "Customer Success Manager",
+        "HR Manager",
+        "Financial Analyst",
+        "Accountant",
+    ],
+    "Content & Marketing": [
+        "Technical Writer",
+        "Content Writer",
+        "SEO Specialist",
+        "Digital Marketing Specialist",
+    ],
+}
+
+CATEGORIES_JSON = orjson.dumps([
+    {"category": category, "positions": positions}
+    for category, positions in JOB_CATEGORIES.items()
+])
+CATEGORIES_JSON_GZ = gzip.compress(CATEGORIES_JSON, 9)
+
+
+@app.get("/api/categories", responses={200: {"model": List[JobCategoryResponse]}}, tags=["Categories"])
+async def get_job_categories(request: Request, api_key: str = Security(verify_api_key)):
     """Get all job positions organized by categories (API Key Required)"""
-    categories = {
-        "Software Development": [
-            "Software Developer",
-            "Software Engineer",
-            "Full Stack Developer",
-            "Frontend Developer",
-            "Backend Developer",
-            "Mobile Developer",
-        ],
-        "Data & AI": [
-            "Data Scientist",
-            "Data Analyst",
-            "Data Engineer",
-            "Machine Learning Engineer",
-            "AI Engineer",
-        ],
-        "DevOps & Cloud": [
-            "DevOps Engineer",
-            "Cloud Engineer",
-            "System Administrator",
-            "Network Engineer",
-            "Database Administrator",
-        ],
-        "Design": [
-            "UI/UX Designer",
-            "Graphic Designer",
-            "Web Designer",
-        ],
-        "Management": [
-            "Product Manager",
-            "Project Manager",
-            "Scrum Master",
-        ],
-        "Quality Assurance": [
-            "Quality Assurance Engineer",
-            "QA Tester",
-        ],
-        "Security": [
-            "Security Engineer",
-        ],
-        "Business": [
-            "Business Analyst",
-            "Marketing Manager",
-            "Sales Manager",
-            "Customer Success Manager",
-            "HR Manager",
-            "Financial Analyst",
-            "Accountant",
-        ],
-        "Content & Marketing": [
-            "Technical Writer",
-            "Content Writer",
-            "SEO Specialist",
-            "Digital Marketing Specialist",
-        ],
-    }
-
-    return [
-        {"category": category, "positions": positions}
-        for category, positions in categories.items()
-    ]
-
-
-@app.get("/api/all-jobs", response_model=AllJobsResponse, tags=["Categories"])
-async def get_all_jobs_with_skills(api_key: str = Security(verify_api_key)):
-    """Get all job positions with their skills organized by categories (API Key Required)"""
-    categories = {
-        "Software Development": {},
-        "Data & AI": {},
-        "DevOps & Cloud": {},
-        "Design": {},
-        "Management": {},
-        "Quality Assurance": {},
-        "Security": {},
-        "Business": {},
-        "Content & Marketing": {},
-    }
-
-    category_mapping = {
-        "Software Development": [
-            "software developer", "software engineer", "full stack developer",
-            "frontend developer", "backend developer", "mobile developer"
-        ],
-        "Data & AI": [
-            "data scientist", "data analyst", "data engineer",
-            "machine learning engineer", "ai engineer"
-        ],
-        "DevOps & Cloud": [
-            "devops engineer", "cloud engineer", "system administrator",
-            "network engineer", "database administrator"
-        ],
-        "Design": [
-            "ui/ux designer", "graphic designer", "web designer"
-        ],
-        "Management": [
-            "product manager", "project manager", "scrum master"
-        ],
-        "Quality Assurance": [
-            "quality assurance engineer", "qa tester", "qa engineer"
-        ],
-        "Security": [
-            "security engineer"
-        ],
-        "Business": [
-            "business analyst", "marketing manager", "sales manager",
-            "customer success manager", "hr manager", "financial analyst", "accountant"
-        ],
-        "Content & Marketing": [
-            "technical writer", "content writer", "seo specialist",
-            "digital marketing specialist"
-        ],
-    }
+    return _cached_json_response(request, CATEGORIES_JSON, CATEGORIES_JSON_GZ)
+
+
+# Category order for /api/all-jobs and the lowercase job_skills keys in each
+_CATEGORY_NAMES = (
+    "Software Development",
+    "Data & AI",
+    "DevOps & Cloud",
+    "Design",
+    "Management",
+    "Quality Assurance",
+    "Security",
+    "Business",
+    "Content & Marketing",
+)
 
-    for category, positions in category_mapping.items():
-        for position in positions:
-            if position in job_skills:
-                categories[category][position] = job_skills[position]
+_CATEGORY_MAPPING = {
+    "Software Development": [
+        "software developer", "software engineer", "full stack developer",
+        "frontend developer", "backend developer", "mobile developer"
+    ],
+    "Data & AI": [
+        "data scientist", "data analyst", "data engineer",
+        "machine learning engineer", "ai engineer"
+    ],
+    "DevOps & Cloud": [
+        "devops engineer", "cloud engineer", "system administrator",
+        "network engineer", "database administrator"
+    ],
+    "Design": [
+        "ui/ux designer", "graphic designer", "web designer"
+    ],
+    "Management": [
+        "product manager", "project manager", "scrum master"
+    ],
+    "Quality Assurance": [
+        "quality assurance engineer", "qa tester", "qa engineer"
+    ],
+    "Security": [
+        "security engineer"
+    ],
+    "Business": [
+        "business analyst", "marketing manager", "sales manager",
+        "customer success manager", "hr manager", "financial analyst", "accountant"
+    ],
+    "Content & Marketing": [
+        "technical writer", "content writer", "seo specialist",
+        "digital marketing specialist"
+    ],
+}
+
+
+# Reverse lookup of _CATEGORY_MAPPING, in category order
+POSITION_TO_CATEGORY = {
+    position: category
+    for category, positions in _CATEGORY_MAPPING.items()
+    for position in positions
+}
+
+
+def _build_all_jobs() -> dict:
+    """Build the /api/all-jobs payload grouping job_skills by category"""
+    categories = {category: {} for category in _CATEGORY_NAMES}
+
+    for position, category in POSITION_TO_CATEGORY.items():
+        skills = job_skills.get(position)
+        if skills is not None:
+            categories[category][position] = skills
 
     return {
         "categories": categories,
@@ -360,17 +551,27 @@ async def get_all_jobs_with_skills(api_key: str = Security(verify_api_key)):
     }
 
 
+ALL_JOBS_JSON = orjson.dumps(_build_all_jobs())
+ALL_JOBS_JSON_GZ = gzip.compress(ALL_JOBS_JSON, 9)
+
+
+@app.get("/api/all-jobs", responses={200: {"model": AllJobsResponse}}, tags=["Categories"])
+async def get_all_jobs_with_skills(request: Request, api_key: str = Security(verify_api_key)):
+    """Get all job positions with their skills organized by categories (API Key Required)"""
+    return _cached_json_response(request, ALL_JOBS_JSON, ALL_JOBS_JSON_GZ)
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "Job Portal Skills API"}
+    return Response(HEALTH_JSON, media_type="application/json")
 
 
 # ====================
 # DEGREES ENDPOINTS
 # ====================
 
-@app.get("/api/degrees", response_model=DegreesResponse, tags=["Degrees"])
+@app.get("/api/degrees", responses={200: {"model": DegreesResponse}}, tags=["Degrees"])
 async def get_all_degrees(
     limit: int = Query(100, ge=1, le=500, description="Maximum number of degrees to return"),
     api_key: str = Security(verify_api_key)
@@ -387,7 +588,7 @@ async def get_all_degrees(
     }
 
 
-@app.get("/api/degrees/search", response_model=DegreeSearchResponse, tags=["Degrees"])
+@app.get("/api/degrees/search", responses={200: {"model": DegreeSearchResponse}}, tags=["Degrees"])
 async def search_degrees_endpoint(
     q: str = Query(..., min_length=1, description="Search query for degrees"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
@@ -412,7 +613,7 @@ async def search_degrees_endpoint(
     }
 
 
-@app.get("/api/degrees/categories", response_model=DegreeCategoriesResponse, tags=["Degrees"])
+@app.get("/api/degrees/categories", responses={200: {"model": DegreeCategoriesResponse}}, tags=["Degrees"])
 async def get_degree_categories_endpoint(api_key: str = Security(verify_api_key)):
     """
     Get all degree categories with their degrees (API Key Required)
@@ -431,7 +632,7 @@ async def get_degree_categories_endpoint(api_key: str = Security(verify_api_key)
     }
 
 
-@app.get("/api/degrees/categories/{category}", response_model=DegreeCategoryResponse, tags=["Degrees"])
+@app.get("/api/degrees/categories/{category}", responses={200: {"model": DegreeCategoryResponse}}, tags=["Degrees"])
 async def get_degrees_by_category_endpoint(
     category: str,
     api_key: str = Security(verify_api_key)
@@ -459,4 +660,18 @@ async def get_degrees_by_category_endpoint(
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Development runner; in production use: gunicorn main:app -c gunicorn.conf.py
+    import uvicorn
+
+    # "auto" picks uvloop and httptools when installed (see requirements.txt)
+    # and falls back to asyncio/h11 where they are unavailable (e.g. Windows)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        access_log=False,
+        log_level="warning",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
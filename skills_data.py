@@ -2,6 +2,7 @@
 Job positions and their relevant skills database
 Contains 40-50 skills for each job position
 """
+from types import MappingProxyType
 
 # List of common job positions
 common_positions = [
@@ -1138,3 +1139,7 @@ job_skills = {
         'Organization', 'Documentation', 'Microsoft Office', 'CPA', 'Certification',
     ],
 }
+
+# Freeze the data at import so it is shared read-only across requests and workers
+common_positions = tuple(common_positions)
+job_skills = MappingProxyType({position: tuple(skills) for position, skills in job_skills.items()})
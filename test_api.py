@@ -4,6 +4,7 @@ Run this before deploying to Vercel
 """
 import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 import os
@@ -19,25 +20,27 @@ if not API_KEY:
     print("Please set API_KEYS in your .env file")
     sys.exit(1)
 
+# Reuse one keep-alive connection pool for every request
+session = requests.Session()
+
 def test_endpoint(name, endpoint, requires_auth=True, method="GET"):
-    """Test a single endpoint"""
+    """Test a single endpoint and return (passed, report)"""
     url = f"{BASE_URL}{endpoint}"
     headers = {"X-API-Key": API_KEY} if requires_auth else {}
 
     try:
         if method == "GET":
-            response = requests.get(url, headers=headers, timeout=5)
+            response = session.get(url, headers=headers, timeout=5)
 
         if response.status_code in [200, 201]:
-            print(f"✅ {name}: PASSED (Status {response.status_code})")
-            return True
+            return True, f"✅ {name}: PASSED (Status {response.status_code})"
         else:
-            print(f"❌ {name}: FAILED (Status {response.status_code})")
-            print(f"   Response: {response.text[:100]}")
-            return False
+            return False, (
+                f"❌ {name}: FAILED (Status {response.status_code})\n"
+                f"   Response: {response.text[:100]}"
+            )
     except Exception as e:
-        print(f"❌ {name}: ERROR - {str(e)}")
-        return False
+        return False, f"❌ {name}: ERROR - {str(e)}"
 
 def main():
     print("\n" + "="*60)
@@ -64,8 +67,13 @@ def main():
     passed = 0
     failed = 0
 
-    for name, endpoint, requires_auth in tests:
-        if test_endpoint(name, endpoint, requires_auth):
+    # Endpoints are independent, so check them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda test: test_endpoint(*test), tests))
+
+    for ok, report in results:
+        print(report)
+        if ok:
             passed += 1
         else:
             failed += 1